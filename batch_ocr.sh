@@ -39,4 +39,4 @@ docker run --rm \
 
 echo ""
 echo -e "${GREEN}✓ Batch processing complete!${NC}"
-echo -e "Results saved to: output/batch_results.json"
+echo -e "Results saved to: output/batch_results.jsonl"
@@ -15,14 +15,28 @@ KEY IMPROVEMENTS (v2.1):
 __version__ = "2.1.0"
 
 import argparse
+import asyncio
+import base64
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import io
+import itertools
 import json
+import math
+import multiprocessing
 import os
+import queue
+import signal
+import stat
 import sys
+import threading
 from pathlib import Path
 import time
-from typing import Dict, List, Any, Optional
-import tempfile
-import atexit
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Progress bar
 try:
@@ -31,44 +45,152 @@ try:
 except ImportError:
     HAS_TQDM = False
 
-# HEIC support
+# Fast JSON encoding (falls back to the json module)
 try:
-    from pillow_heif import register_heif_opener
-    register_heif_opener()
-    HEIC_SUPPORTED = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HEIC_SUPPORTED = False
+    HAS_ORJSON = False
 
-# Track temporary files for cleanup
-temp_files = []
+# HEIC support (pillow-heif is imported and registered on the first HEIC image)
+HEIC_SUPPORTED = importlib.util.find_spec('pillow_heif') is not None
+_heif_registered = False
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
 
 # Global verbose flag
 VERBOSE = True
 
-def cleanup_temp_files():
-    """Clean up temporary converted files"""
-    for f in temp_files:
-        try:
-            if os.path.exists(f):
-                os.remove(f)
-        except:
-            pass
+# File extensions picked up in batch mode (lower case, without the dot)
+_IMG_EXTS = frozenset({'jpg', 'jpeg', 'png', 'bmp', 'tiff', 'tif', 'heic', 'heif', 'webp'})
+
+# Directory for decoded HEIC images (--heic-cache); None disables the cache
+HEIC_CACHE_DIR = None
+
+# Keep the last few decoded HEIC images in memory (server mode, where the
+# same photo is often sent again); batch mode reads every file once
+HEIC_MEMORY_CACHE = False
+
+# Images per engine call in batch mode (--batch-size)
+BATCH_SIZE = 16
+
+# Processes decoding HEIC images in parallel during batch mode; 0 decodes in-process
+HEIC_DECODE_WORKERS = 0
+_heic_pool = None
+
+# Long-side limit per engine; larger images are downscaled (LANCZOS) before OCR.
+# Recognition accuracy plateaus well below phone-camera resolutions, while the
+# detection models' cost grows with pixel count. Surya tiles internally (None = full size).
+MAX_SIDE = {
+    'paddleocr': 1600,
+    'easyocr': 1600,
+    'tesseract': 2400,
+    'surya': None,
+    'paddleocr-vl': 2048,
+}
+
+# HTTP statuses worth retrying against a remote OCR server, and how often
+VL_RETRY_STATUSES = {429, 502, 503, 504}
+VL_RETRY_ATTEMPTS = 3
+
+# Python modules backing each engine (any one of them is enough)
+ENGINE_MODULES = {
+    'paddleocr': ('paddleocr',),
+    'easyocr': ('easyocr',),
+    'surya': ('surya',),
+    'tesseract': ('tesserocr', 'pytesseract'),
+    'paddleocr-vl': ('aiohttp',),
+}
+
+# Engines that run on the GPU when one is available
+GPU_ENGINES = {'paddleocr', 'easyocr', 'surya'}
 
-atexit.register(cleanup_temp_files)
+# Threads running Tesseract side by side on a batch (one per core; 1 in pool workers)
+TESSERACT_THREADS = os.cpu_count() or 1
+
+# Per-thread tesserocr API for the Tesseract batch threads
+_tesserocr_local = threading.local()
+
+# Engines that initialized in this --workers process (set by _init_worker)
+_worker_engines = []
+
+
+@functools.lru_cache(maxsize=1)
+def cuda_info() -> Optional[tuple]:
+    """
+    Query CUDA once per process: (device name, total memory in GiB) of the
+    first GPU, or None without CUDA. Importing torch and initializing the
+    driver is slow, so later callers reuse the cached answer.
+    """
+    try:
+        import torch
+        if not torch.cuda.is_available():
+            return None
+        name = torch.cuda.get_device_name(0)
+        total_gb = torch.cuda.get_device_properties(0).total_memory / 1024 ** 3
+        return name, total_gb
+    except ImportError:
+        return None
+    except Exception:
+        return None
 
 
 def detect_gpu():
     """Detect if GPU/CUDA is available"""
+    info = cuda_info()
+    if info is not None and VERBOSE:
+        print(f"✓ GPU detected: {info[0]}")
+    return info is not None
+
+
+def detect_device() -> str:
+    """Detect the best available torch device: 'cuda', 'mps' or 'cpu'"""
+    if detect_gpu():
+        return 'cuda'
     try:
         import torch
-        has_cuda = torch.cuda.is_available()
-        if has_cuda and VERBOSE:
-            print(f"✓ GPU detected: {torch.cuda.get_device_name(0)}")
-        return has_cuda
+        if torch.backends.mps.is_available():
+            if VERBOSE:
+                print("✓ Apple MPS detected")
+            return 'mps'
     except ImportError:
-        return False
+        pass
     except Exception:
-        return False
+        pass
+    return 'cpu'
+
+
+def default_surya_batch_size() -> Optional[int]:
+    """
+    Pick a Surya detector/recognizer batch size from the GPU's memory:
+    small cards run out of VRAM with large batches, big cards sit idle with
+    small ones. Returns None (keep Surya's defaults) without CUDA.
+    """
+    info = cuda_info()
+    if info is None:
+        return None
+    total_gb = info[1]
+    if total_gb < 8:
+        return 4
+    if total_gb < 16:
+        return 16
+    return 32
+
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact or indented by 2, with orjson when installed"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_json(data) -> Any:
+    """Parse JSON from bytes or str, with orjson when installed"""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
 
 
 def vprint(*args, **kwargs):
@@ -87,12 +209,39 @@ class OCREngineManager:
     This dramatically improves performance (10-100x faster for batch processing).
     """
     _instances = {}
-    _available_engines = []
+    _device = None
+    _config = {
+        'device': 'auto',
+        'paddle_hpi': True,
+        # Half the cores, leaving room for other engines running alongside (--engine all)
+        'paddle_cpu_threads': max(1, (os.cpu_count() or 1) // 2),
+        'paddle_mkldnn': True,
+        'vl_server_url': None,
+        'vl_model': 'PaddleOCR-VL-0.9B',
+        'vl_max_concurrency': 8,
+        'vl_rps': 0.0,
+        'surya_det_batch': None,
+        'surya_rec_batch': None,
+    }
+
+    @classmethod
+    def configure(cls, **options):
+        """Set engine construction options (must be called before the engine is first used)"""
+        cls._config.update(options)
+        cls._device = None
+
+    @classmethod
+    def get_config(cls) -> Dict[str, Any]:
+        """Get a copy of the engine construction options"""
+        return cls._config.copy()
 
     @classmethod
-    def get_available_engines(cls):
-        """Get list of available engines"""
-        return cls._available_engines.copy()
+    def get_device(cls) -> str:
+        """Resolve the configured device ('auto' is detected once)"""
+        if cls._device is None:
+            device = cls._config['device']
+            cls._device = detect_device() if device == 'auto' else device
+        return cls._device
 
     @classmethod
     def get_paddleocr(cls):
@@ -100,20 +249,44 @@ class OCREngineManager:
         if 'paddleocr' not in cls._instances:
             try:
                 from paddleocr import PaddleOCR
-                use_gpu = detect_gpu()
+                explicit_device = cls._config['device'] != 'auto'
+                device = cls.get_device()
+                use_gpu = device == 'cuda'
                 vprint(f"🔧 Initializing PaddleOCR (one-time setup, GPU: {use_gpu})...")
                 # Note: PaddleOCR 3.x API changes:
                 # - show_log removed
                 # - use_angle_cls -> use_textline_orientation
                 # - use_gpu removed (auto-detects)
-                # - enable_mkldnn removed
                 # - use_mp removed
-                cls._instances['paddleocr'] = PaddleOCR(
-                    use_textline_orientation=True,
-                    lang='en'
-                )
-                if 'paddleocr' not in cls._available_engines:
-                    cls._available_engines.append("paddleocr")
+                paddle_kwargs = {
+                    'use_textline_orientation': True,
+                    'lang': 'en',
+                }
+                # Without --device, Paddle picks GPU/CPU from its own build;
+                # it has no MPS backend, so anything but CUDA means CPU
+                if explicit_device:
+                    paddle_kwargs['device'] = 'gpu' if use_gpu else 'cpu'
+                if not use_gpu:
+                    # Images go through one at a time; larger recognition batches
+                    # only make Paddle's CPU allocator reserve extra arena chunks
+                    paddle_kwargs['text_recognition_batch_size'] = 1
+                    paddle_kwargs['textline_orientation_batch_size'] = 1
+                    paddle_kwargs['cpu_threads'] = cls._config['paddle_cpu_threads']
+                    # oneDNN's kernel setup costs more than it saves on a single image
+                    paddle_kwargs['enable_mkldnn'] = cls._config['paddle_mkldnn']
+                # High-performance inference: lets PaddleX pick OpenVINO/ONNX Runtime/TensorRT
+                # (install with: paddleocr install_hpi_deps cpu|gpu)
+                hpi_kwargs = {}
+                if cls._config['paddle_hpi']:
+                    hpi_kwargs['enable_hpi'] = True
+                try:
+                    cls._instances['paddleocr'] = PaddleOCR(**paddle_kwargs, **hpi_kwargs)
+                except Exception as e:
+                    if not hpi_kwargs:
+                        raise
+                    # Older paddleocr or missing HPI dependencies
+                    vprint(f"⚠️  PaddleOCR high-performance inference unavailable ({e}), using default backend")
+                    cls._instances['paddleocr'] = PaddleOCR(**paddle_kwargs)
                 vprint("✓ PaddleOCR ready")
             except ImportError:
                 vprint("❌ PaddleOCR not available (pip install paddleocr paddlepaddle)")
@@ -129,17 +302,21 @@ class OCREngineManager:
         if 'easyocr' not in cls._instances:
             try:
                 import easyocr
-                use_gpu = detect_gpu()
-                vprint(f"🔧 Initializing EasyOCR (one-time setup, GPU: {use_gpu})...")
-                cls._instances['easyocr'] = easyocr.Reader(
+                device = cls.get_device()
+                use_gpu = device != 'cpu'
+                vprint(f"🔧 Initializing EasyOCR (one-time setup, device: {device})...")
+                reader = easyocr.Reader(
                     ['en'],
-                    gpu=use_gpu,
+                    # EasyOCR takes a device name ('cuda', 'mps') in place of True
+                    gpu=device if use_gpu else False,
+                    # int8 dynamic quantization on CPU, cuDNN kernel autotuning on CUDA
+                    quantize=not use_gpu,
+                    cudnn_benchmark=device == 'cuda',
                     verbose=False,
                     download_enabled=True,
                     model_storage_directory=os.path.expanduser('~/.EasyOCR/model')
                 )
-                if 'easyocr' not in cls._available_engines:
-                    cls._available_engines.append("easyocr")
+                cls._instances['easyocr'] = reader
                 vprint("✓ EasyOCR ready")
             except ImportError:
                 vprint("❌ EasyOCR not available (pip install easyocr)")
@@ -154,6 +331,19 @@ class OCREngineManager:
         """Get or create Surya OCR models (singleton)"""
         if 'surya' not in cls._instances:
             try:
+                # Surya reads its torch device and batch sizes from the environment at import time
+                if cls._config['device'] != 'auto':
+                    os.environ['TORCH_DEVICE'] = cls._config['device']
+                auto_batch = None
+                if cls.get_device() == 'cuda':
+                    auto_batch = default_surya_batch_size()
+                for env_name, option in (('DETECTOR_BATCH_SIZE', 'surya_det_batch'),
+                                         ('RECOGNITION_BATCH_SIZE', 'surya_rec_batch')):
+                    if cls._config[option]:
+                        os.environ[env_name] = str(cls._config[option])
+                    elif auto_batch:
+                        os.environ.setdefault(env_name, str(auto_batch))
+
                 from surya.ocr import run_ocr
                 from surya.model.detection.model import load_model as load_det_model
                 from surya.model.detection.processor import load_processor as load_det_processor
@@ -168,8 +358,6 @@ class OCREngineManager:
                     'rec_model': load_rec_model(),
                     'rec_processor': load_rec_processor(),
                 }
-                if 'surya' not in cls._available_engines:
-                    cls._available_engines.append("surya")
                 vprint("✓ Surya OCR ready")
             except ImportError:
                 vprint("❌ Surya OCR not available (pip install surya-ocr)")
@@ -181,16 +369,43 @@ class OCREngineManager:
 
     @classmethod
     def get_tesseract(cls):
-        """Get or verify Tesseract availability"""
+        """
+        Get or verify Tesseract availability.
+        Prefers tesserocr (libtesseract in-process, one API reused for every image)
+        over pytesseract (one tesseract subprocess plus a PNG encode per call).
+        """
         if 'tesseract' not in cls._instances:
+            # Batches run TESSERACT_THREADS recognitions at once; Tesseract's own
+            # OpenMP threads on top of that oversubscribe the CPU, so limit it to
+            # one thread (unless OMP_THREAD_LIMIT is set) without capping torch or
+            # Paddle loaded later. libgomp reads the variable once when it loads,
+            # so it is only set while tesserocr imports libtesseract. (If another
+            # engine already loaded the same libgomp, Tesseract is not capped.)
+            thread_limit = {'OMP_THREAD_LIMIT': os.environ.get('OMP_THREAD_LIMIT', '1')}
+            try:
+                limit_set = 'OMP_THREAD_LIMIT' not in os.environ
+                os.environ.update(thread_limit)
+                try:
+                    import tesserocr
+                finally:
+                    if limit_set:
+                        del os.environ['OMP_THREAD_LIMIT']
+                api = _new_tesserocr_api()
+                cls._instances['tesseract'] = {'tesserocr': api}
+                vprint(f"✓ Tesseract {tesserocr.tesseract_version().splitlines()[0]} ready (tesserocr)")
+                return cls._instances['tesseract']
+            except ImportError:
+                pass
+            except Exception as e:
+                vprint(f"⚠️  tesserocr unavailable ({e}), using pytesseract")
+
             try:
                 import pytesseract
-                from PIL import Image
+                # pytesseract starts tesseract with env=pytesseract.pytesseract.environ
+                pytesseract.pytesseract.environ = {**os.environ, **thread_limit}
                 # Test if tesseract is installed
                 version = pytesseract.get_tesseract_version()
-                cls._instances['tesseract'] = pytesseract
-                if 'tesseract' not in cls._available_engines:
-                    cls._available_engines.append("tesseract")
+                cls._instances['tesseract'] = {'pytesseract': pytesseract}
                 vprint(f"✓ Tesseract {version} ready")
             except ImportError:
                 vprint("❌ Tesseract not available (pip install pytesseract)")
@@ -200,49 +415,332 @@ class OCREngineManager:
                 return None
         return cls._instances.get('tesseract')
 
+    @classmethod
+    def get_tesseract_pool(cls) -> Optional[ThreadPoolExecutor]:
+        """
+        Get or create the thread pool for Tesseract batches (singleton).
+        Tesseract runs outside the GIL (in libtesseract or a subprocess), so
+        threads recognize several images at once. With tesserocr every thread
+        gets its own API, since one PyTessBaseAPI can't be used concurrently.
+        get_tesseract() limits each call to one OpenMP thread.
+        """
+        tesseract = cls.get_tesseract()
+        if tesseract is None:
+            return None
+        if 'pool' not in tesseract:
+            initializer = _init_tesserocr_thread if 'tesserocr' in tesseract else None
+            tesseract['pool'] = ThreadPoolExecutor(max_workers=max(1, TESSERACT_THREADS),
+                                                   thread_name_prefix='tesseract',
+                                                   initializer=initializer)
+        return tesseract['pool']
+
+    @classmethod
+    def get_paddleocr_vl(cls):
+        """Get or create the remote PaddleOCR-VL server client settings (singleton)"""
+        if 'paddleocr-vl' not in cls._instances:
+            try:
+                import aiohttp
+
+                if not cls._config['vl_server_url']:
+                    raise Exception("no server configured (--vl-server-url)")
+                cls._instances['paddleocr-vl'] = {
+                    'url': cls._config['vl_server_url'].rstrip('/') + '/chat/completions',
+                    'model': cls._config['vl_model'],
+                    'max_concurrency': max(1, cls._config['vl_max_concurrency']),
+                    # Shared across batches so --rps holds for the whole run
+                    'limiter': RateLimiter(cls._config['vl_rps']),
+                }
+                vprint(f"✓ PaddleOCR-VL server: {cls._config['vl_server_url']}")
+            except ImportError:
+                vprint("❌ PaddleOCR-VL server mode not available (pip install aiohttp)")
+                return None
+            except Exception as e:
+                vprint(f"❌ PaddleOCR-VL server not available: {e}")
+                return None
+        return cls._instances.get('paddleocr-vl')
+
+    @staticmethod
+    def probe_engines(engines: List[str]) -> List[str]:
+        """
+        Get the engines whose Python packages are installed.
+        find_spec() only locates the modules, it doesn't import them, so this
+        costs milliseconds instead of loading torch/paddle.
+        """
+        return [engine for engine in engines
+                if any(importlib.util.find_spec(module) is not None
+                       for module in ENGINE_MODULES.get(engine, ()))]
+
+    @classmethod
+    def warm_up(cls, engines: List[str]) -> List[str]:
+        """
+        Initialize the requested engines up front, before any image is processed.
+        Model loading then happens once per process instead of stalling the
+        first image of a batch. Returns the engines that initialized successfully.
+        """
+        getters = {
+            "paddleocr": cls.get_paddleocr,
+            "easyocr": cls.get_easyocr,
+            "surya": cls.get_surya,
+            "tesseract": cls.get_tesseract,
+            "paddleocr-vl": cls.get_paddleocr_vl,
+        }
+        ready = []
+        for engine in engines:
+            getter = getters.get(engine)
+            if getter is not None and getter() is not None:
+                ready.append(engine)
+        return ready
+
 
-def convert_heic_if_needed(image_path: str) -> str:
-    """Convert HEIC to JPEG if needed, return path to usable image"""
-    if not HEIC_SUPPORTED:
-        return image_path
+def iter_images(root: str):
+    """
+    Recursively yield image file paths under root.
+    os.scandir() reuses the file type from the directory listing, so no
+    per-file stat() or Path object is needed. Unreadable subdirectories
+    are skipped with a warning.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                try:
+                    yield from iter_images(entry.path)
+                except OSError as e:
+                    vprint(f"⚠️  Skipping unreadable directory {entry.path}: {e}")
+            elif entry.is_file():
+                # Same rule as Path.suffix: 'jpg' and '.png' have no extension
+                stem, dot, ext = entry.name.rpartition('.')
+                if stem and dot and ext.lower() in _IMG_EXTS:
+                    yield entry.path
+
+
+def default_heic_cache_dir() -> Path:
+    """Get the HEIC cache directory ($XDG_CACHE_HOME/advanced-ocr/heic)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'advanced-ocr' / 'heic'
+
+
+def _heic_cache_path(image_path: str) -> Path:
+    """Cache file for a HEIC image, keyed by its first 64 KiB and its size"""
+    with open(image_path, 'rb') as f:
+        head = f.read(65536)
+    key = head + str(os.path.getsize(image_path)).encode()
+    return HEIC_CACHE_DIR / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.png"
+
+
+def _store_heic_cache(image: "Image.Image", cache_path: Path):
+    """Save a decoded HEIC image to the cache (lossless, written atomically)"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+        image.save(temp_path, 'PNG', compress_level=1)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        vprint(f"⚠️  Could not cache HEIC decode: {e}")
 
-    if image_path.lower().endswith(('.heic', '.heif')):
-        try:
+
+def _register_heif():
+    """Register pillow-heif's HEIC/HEIF opener with PIL (once per process)"""
+    global _heif_registered
+    if not _heif_registered:
+        from pillow_heif import register_heif_opener
+        register_heif_opener()
+        _heif_registered = True
+
+
+def _decode_rgb(path, max_side: Optional[int] = None) -> "Image.Image":
+    """
+    Decode an image file into RGB pixels, upright according to its EXIF orientation.
+    With max_side, JPEGs are decoded at a reduced scale (1/2, 1/4 or 1/8, done
+    by libjpeg in the DCT domain) as long as the long side stays >= max_side.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as image:
+        width, height = image.size
+        if max_side is not None and max(width, height) > max_side:
+            # draft() keeps both sides at least the requested size, so ask for
+            # the image scaled to max_side rather than a max_side square
+            scale = max_side / max(width, height)
+            image.draft('RGB', (math.ceil(width * scale), math.ceil(height * scale)))
+        # Phone photos are often stored sideways with an orientation tag;
+        # OCR on the raw pixels would read rotated text
+        if image.getexif().get(0x0112, 1) != 1:
+            image = ImageOps.exif_transpose(image)
+        if image.mode != 'RGB':
+            return image.convert('RGB')
+        # Already RGB (JPEG, HEIC): decode in place, convert() would copy every pixel
+        image.load()
+        return image
+
+
+def is_heic(image_path: str) -> bool:
+    """Check whether a path names a HEIC/HEIF image"""
+    return image_path.lower().endswith(('.heic', '.heif'))
+
+
+def load_image(image_path: str, max_side: Optional[int] = None) -> "Image.Image":
+    """
+    Decode an image (including HEIC/HEIF) into an RGB PIL image.
+    Every engine accepts in-memory images, so nothing is written to disk,
+    except for the optional HEIC cache (--heic-cache): HEVC decoding is
+    slow, so repeat runs reuse a lossless PNG of the decoded pixels.
+    max_side lets JPEG decoding skip resolution no engine will use.
+    """
+    if is_heic(image_path):
+        if not HEIC_SUPPORTED:
+            raise Exception("HEIC support not available (pip install pillow-heif)")
+
+        if HEIC_MEMORY_CACHE:
+            file_stat = os.stat(image_path)
+            # A copy, so callers can't modify the cached image
+            return _decode_heic_cached(os.path.abspath(image_path), file_stat.st_mtime_ns, file_stat.st_size).copy()
+        return _decode_heic(image_path)
+
+    return _decode_rgb(image_path, max_side)
+
+
+@functools.lru_cache(maxsize=4)
+def _decode_heic_cached(image_path: str, mtime_ns: int, size: int) -> "Image.Image":
+    """
+    _decode_heic() memoized on (path, mtime, size), so an edited file is decoded again.
+    Kept small: a decoded 12 MP photo takes about 36 MB.
+    """
+    return _decode_heic(image_path)
+
+
+def _decode_heic(image_path: str) -> "Image.Image":
+    """Decode a HEIC/HEIF image, through the --heic-cache directory when enabled"""
+    cache_path = _heic_cache_path(image_path) if HEIC_CACHE_DIR is not None else None
+    if cache_path is not None and cache_path.exists():
+        vprint(f"📸 Using cached HEIC decode: {os.path.basename(image_path)}")
+        return _decode_rgb(cache_path)
+
+    vprint(f"📸 Decoding HEIC: {os.path.basename(image_path)}")
+    _register_heif()
+    image = _decode_rgb(image_path)
+    if cache_path is not None:
+        _store_heic_cache(image, cache_path)
+    return image
+
+
+def decode_max_side(engines: List[str]) -> Optional[int]:
+    """Largest MAX_SIDE among the engines, i.e. the resolution worth decoding (None = full size)"""
+    max_sides = [MAX_SIDE.get(engine) for engine in engines]
+    if not max_sides or None in max_sides:
+        return None
+    return max(max_sides)
+
+
+def _init_heic_worker(verbose: bool, heic_cache_dir: Optional[Path]):
+    """Process pool initializer for the HEIC decode processes"""
+    global VERBOSE, HEIC_CACHE_DIR
+    VERBOSE = verbose
+    HEIC_CACHE_DIR = heic_cache_dir
+
+
+def _load_image_pixels(image_path: str):
+    """load_image() in a HEIC decode process; returns (size, RGB bytes), which pickle cheaply"""
+    image = load_image(image_path)
+    return image.size, image.tobytes()
+
+
+def heic_decode_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the HEIC decode process pool (started on first use), or None when
+    HEIC_DECODE_WORKERS is 0. HEVC decoding is CPU-bound and takes seconds
+    per photo, so a chunk's HEIC images are decoded side by side.
+    """
+    global _heic_pool
+    if _heic_pool is None and HEIC_DECODE_WORKERS > 0:
+        _heic_pool = ProcessPoolExecutor(
+            max_workers=HEIC_DECODE_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_heic_worker,
+            initargs=(False, HEIC_CACHE_DIR)
+        )
+    return _heic_pool
+
+
+def shutdown_heic_decode_pool():
+    """Stop the HEIC decode processes, if they were started"""
+    global _heic_pool
+    if _heic_pool is not None:
+        _heic_pool.shutdown()
+        _heic_pool = None
+
+
+class DecodedImage:
+    """
+    A decoded image shared by all engines, plus the downscaled copies
+    (PIL image and NumPy array) requested through MAX_SIDE.
+    Each size is computed at most once per image.
+    """
+
+    def __init__(self, image_pil: "Image.Image"):
+        self.image_pil = image_pil
+        self._variants = {}
+
+    def variant(self, max_side: Optional[int]):
+        """Get (image_np, image_pil) with the long side limited to max_side (None = full size)"""
+        if max_side not in self._variants:
+            import numpy as np
             from PIL import Image
-            vprint(f"📸 Converting HEIC: {os.path.basename(image_path)}")
-            img = Image.open(image_path)
 
-            # Create temp JPEG file
-            temp_fd, jpeg_path = tempfile.mkstemp(suffix='.jpg', prefix='ocr_')
-            os.close(temp_fd)
+            image_pil = self.image_pil
+            if max_side is not None and max(image_pil.size) > max_side:
+                image_pil = image_pil.copy()
+                image_pil.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+            self._variants[max_side] = (np.asarray(image_pil), image_pil)
+        return self._variants[max_side]
 
-            img.convert('RGB').save(jpeg_path, 'JPEG', quality=95)
-            temp_files.append(jpeg_path)
-            vprint(f"✓ Converted to JPEG")
-            return jpeg_path
-        except Exception as e:
-            vprint(f"⚠️  HEIC conversion failed: {e}")
-            return image_path
 
-    return image_path
+class LineCollector:
+    """
+    Collects recognized lines straight into one text buffer, counting them and
+    summing their confidences as they arrive, instead of building lists of
+    strings and confidences only to join and average them.
+    """
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self.count = 0
+        self._confidence_total = 0.0
 
+    def add(self, text: str, confidence: float):
+        """Append a recognized line and its confidence"""
+        if self.count:
+            self._buffer.write('\n')
+        self._buffer.write(text)
+        self.count += 1
+        self._confidence_total += confidence
 
-def process_paddleocr(image_path: str) -> Dict[str, Any]:
+    @property
+    def text(self) -> str:
+        """All lines, newline-separated"""
+        return self._buffer.getvalue()
+
+    @property
+    def avg_confidence(self) -> float:
+        """Mean line confidence (0.0 without lines)"""
+        return self._confidence_total / self.count if self.count else 0.0
+
+
+def process_paddleocr(image_np: "np.ndarray", image_pil: "Image.Image") -> Dict[str, Any]:
     """Process image with PaddleOCR (singleton instance)"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
+        import numpy as np
+
         ocr = OCREngineManager.get_paddleocr()
         if ocr is None:
             raise Exception("PaddleOCR not available")
 
         # PaddleOCR 3.x uses predict() instead of ocr()
-        result = ocr.predict(image_path)
-
-        texts = []
-        confidences = []
-
+        # Arrays are read as OpenCV-style BGR, so flip the RGB channels
+        result = ocr.predict(np.ascontiguousarray(image_np[:, :, ::-1]))
 
+        lines = LineCollector()
 
         # PaddleOCR 3.x returns different structure
         if isinstance(result, dict):
@@ -250,13 +748,11 @@ def process_paddleocr(image_path: str) -> Dict[str, Any]:
             if 'rec_text' in result and 'rec_score' in result:
                 # Text recognition results
                 for text, score in zip(result['rec_text'], result['rec_score']):
-                    texts.append(text)
-                    confidences.append(float(score))
+                    lines.add(text, float(score))
             elif 'dt_polys' in result and 'rec_text' in result:
                 # Detection + recognition results
                 for text, score in zip(result['rec_text'], result.get('rec_score', [])):
-                    texts.append(text)
-                    confidences.append(float(score) if score else 0.0)
+                    lines.add(text, float(score) if score else 0.0)
             else:
                 # Unknown dict format, try to extract text
                 vprint(f"DEBUG: Unknown dict format, keys: {list(result.keys())}")
@@ -276,39 +772,30 @@ def process_paddleocr(image_path: str) -> Dict[str, Any]:
 
                     if isinstance(rec_texts, list):
                         for i, text in enumerate(rec_texts):
-                            texts.append(text)
-                            if i < len(rec_scores):
-                                confidences.append(float(rec_scores[i]))
-                            else:
-                                confidences.append(0.0)
+                            lines.add(text, float(rec_scores[i]) if i < len(rec_scores) else 0.0)
                     else:
-                        texts.append(str(rec_texts))
-                        confidences.append(float(rec_scores) if rec_scores else 0.0)
+                        lines.add(str(rec_texts), float(rec_scores) if rec_scores else 0.0)
             elif isinstance(first_elem, dict):
                 # New 3.x list of dicts format
                 for item in result:
                     if 'rec_text' in item:
-                        texts.append(item['rec_text'])
-                        confidences.append(float(item.get('rec_score', 0.0)))
+                        lines.add(item['rec_text'], float(item.get('rec_score', 0.0)))
             elif isinstance(first_elem, list):
                 # Old 2.x nested list format: [[bbox, (text, confidence)], ...]
                 for line in result:
                     if len(line) >= 2 and isinstance(line[1], (list, tuple)) and len(line[1]) >= 2:
-                        texts.append(line[1][0])
-                        confidences.append(float(line[1][1]))
+                        lines.add(line[1][0], float(line[1][1]))
             else:
                 raise Exception(f"Unknown list format, first element type: {type(first_elem)}")
         else:
             raise Exception(f"Unexpected result format: {type(result)}")
 
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-
         return {
             "engine": "PaddleOCR",
-            "text": "\n".join(texts),
-            "confidence": round(avg_confidence, 4),
-            "lines": len(texts),
-            "processing_time": round(time.time() - start_time, 2),
+            "text": lines.text,
+            "confidence": round(lines.avg_confidence, 4),
+            "lines": lines.count,
+            "processing_time": round(time.perf_counter() - start_time, 2),
             "success": True
         }
     except Exception as e:
@@ -316,32 +803,31 @@ def process_paddleocr(image_path: str) -> Dict[str, Any]:
             "engine": "PaddleOCR",
             "error": str(e),
             "success": False,
-            "processing_time": round(time.time() - start_time, 2)
+            "processing_time": round(time.perf_counter() - start_time, 2)
         }
 
 
-def process_easyocr(image_path: str) -> Dict[str, Any]:
+def process_easyocr(image_np: "np.ndarray", image_pil: "Image.Image") -> Dict[str, Any]:
     """Process image with EasyOCR (singleton instance)"""
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
         reader = OCREngineManager.get_easyocr()
         if reader is None:
             raise Exception("EasyOCR not available")
 
-        result = reader.readtext(image_path)
+        result = reader.readtext(image_np)
 
-        texts = [item[1] for item in result]
-        confidences = [float(item[2]) for item in result]
-
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        lines = LineCollector()
+        for item in result:
+            lines.add(item[1], float(item[2]))
 
         return {
             "engine": "EasyOCR",
-            "text": "\n".join(texts),
-            "confidence": round(avg_confidence, 4),
-            "lines": len(texts),
-            "processing_time": round(time.time() - start_time, 2),
+            "text": lines.text,
+            "confidence": round(lines.avg_confidence, 4),
+            "lines": lines.count,
+            "processing_time": round(time.perf_counter() - start_time, 2),
             "success": True
         }
     except Exception as e:
@@ -349,27 +835,103 @@ def process_easyocr(image_path: str) -> Dict[str, Any]:
             "engine": "EasyOCR",
             "error": str(e),
             "success": False,
-            "processing_time": round(time.time() - start_time, 2)
+            "processing_time": round(time.perf_counter() - start_time, 2)
         }
 
 
-def process_surya(image_path: str) -> Dict[str, Any]:
-    """Process image with Surya OCR (singleton instance)"""
-    start_time = time.time()
+def process_easyocr_batch(images_np: List["np.ndarray"],
+                          images_pil: List["Image.Image"]) -> List[Dict[str, Any]]:
+    """
+    Process several images with EasyOCR readtext_batched() calls.
+    readtext_batched() stacks the images into one detector tensor, so they must
+    share dimensions: images are grouped so that within a group heights and
+    widths each differ by at most 20%, and padded to their group's largest
+    size. Images without a similar-sized partner are processed on their own.
+    """
+    # Greedy by descending height: an image joins the first group it fits,
+    # each group is [indices, max_height, min_width, max_width]
+    groups = []
+    for index in sorted(range(len(images_np)), key=lambda i: images_np[i].shape[:2], reverse=True):
+        height, width = images_np[index].shape[:2]
+        for group in groups:
+            if (height >= group[1] * 0.8 and
+                    max(width, group[3]) * 0.8 <= min(width, group[2])):
+                group[0].append(index)
+                group[2] = min(width, group[2])
+                group[3] = max(width, group[3])
+                break
+        else:
+            groups.append([[index], height, width, width])
+
+    results = [None] * len(images_np)
+    for indices, _, _, _ in groups:
+        if len(indices) == 1:
+            results[indices[0]] = process_easyocr(images_np[indices[0]], images_pil[indices[0]])
+            continue
+        group_results = _easyocr_readtext_batched([images_np[index] for index in indices])
+        for index, engine_result in zip(indices, group_results):
+            results[index] = engine_result
+    return results
+
+
+def _easyocr_readtext_batched(images_np: List["np.ndarray"]) -> List[Dict[str, Any]]:
+    """Run one EasyOCR readtext_batched() call on similar-sized images, padding them to a common size"""
+    start_time = time.perf_counter()
 
     try:
-        from PIL import Image as PILImage
+        import numpy as np
 
+        reader = OCREngineManager.get_easyocr()
+        if reader is None:
+            raise Exception("EasyOCR not available")
+
+        # White padding on the bottom/right keeps the text where it was
+        height = max(image_np.shape[0] for image_np in images_np)
+        width = max(image_np.shape[1] for image_np in images_np)
+        images_np = [image_np if image_np.shape[:2] == (height, width) else
+                     np.pad(image_np, ((0, height - image_np.shape[0]), (0, width - image_np.shape[1]), (0, 0)),
+                            constant_values=255)
+                     for image_np in images_np]
+
+        batch_result = reader.readtext_batched(images_np, batch_size=len(images_np))
+        processing_time = round((time.perf_counter() - start_time) / len(images_np), 2)
+
+        results = []
+        for result in batch_result:
+            lines = LineCollector()
+            for item in result:
+                lines.add(item[1], float(item[2]))
+            results.append({
+                "engine": "EasyOCR",
+                "text": lines.text,
+                "confidence": round(lines.avg_confidence, 4),
+                "lines": lines.count,
+                "processing_time": processing_time,
+                "success": True
+            })
+        return results
+    except Exception as e:
+        processing_time = round((time.perf_counter() - start_time) / len(images_np), 2)
+        return [{
+            "engine": "EasyOCR",
+            "error": str(e),
+            "success": False,
+            "processing_time": processing_time
+        } for _ in images_np]
+
+
+def process_surya(image_np: "np.ndarray", image_pil: "Image.Image") -> Dict[str, Any]:
+    """Process image with Surya OCR (singleton instance)"""
+    start_time = time.perf_counter()
+
+    try:
         surya = OCREngineManager.get_surya()
         if surya is None:
             raise Exception("Surya OCR not available")
 
-        # Load image
-        image = PILImage.open(image_path)
-
         # Run OCR with pre-loaded models
         predictions = surya['run_ocr'](
-            [image],
+            [image_pil],
             [["en"]],
             surya['det_model'],
             surya['det_processor'],
@@ -377,22 +939,17 @@ def process_surya(image_path: str) -> Dict[str, Any]:
             surya['rec_processor']
         )
 
-        texts = []
-        confidences = []
-
+        lines = LineCollector()
         if predictions and len(predictions) > 0:
             for text_line in predictions[0].text_lines:
-                texts.append(text_line.text)
-                confidences.append(float(text_line.confidence))
-
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+                lines.add(text_line.text, float(text_line.confidence))
 
         return {
             "engine": "Surya",
-            "text": "\n".join(texts),
-            "confidence": round(avg_confidence, 4),
-            "lines": len(texts),
-            "processing_time": round(time.time() - start_time, 2),
+            "text": lines.text,
+            "confidence": round(lines.avg_confidence, 4),
+            "lines": lines.count,
+            "processing_time": round(time.perf_counter() - start_time, 2),
             "success": True
         }
     except Exception as e:
@@ -400,47 +957,139 @@ def process_surya(image_path: str) -> Dict[str, Any]:
             "engine": "Surya",
             "error": str(e),
             "success": False,
-            "processing_time": round(time.time() - start_time, 2)
+            "processing_time": round(time.perf_counter() - start_time, 2)
         }
 
 
-def process_tesseract(image_path: str) -> Dict[str, Any]:
+def process_surya_batch(images_np: List["np.ndarray"],
+                        images_pil: List["Image.Image"]) -> List[Dict[str, Any]]:
+    """Process several images with a single Surya run_ocr() call"""
+    start_time = time.perf_counter()
+
+    try:
+        surya = OCREngineManager.get_surya()
+        if surya is None:
+            raise Exception("Surya OCR not available")
+
+        # run_ocr takes one language list per image
+        predictions = surya['run_ocr'](
+            images_pil,
+            [["en"]] * len(images_pil),
+            surya['det_model'],
+            surya['det_processor'],
+            surya['rec_model'],
+            surya['rec_processor']
+        )
+        processing_time = round((time.perf_counter() - start_time) / len(images_pil), 2)
+
+        results = []
+        for prediction in predictions:
+            lines = LineCollector()
+            for text_line in prediction.text_lines:
+                lines.add(text_line.text, float(text_line.confidence))
+            results.append({
+                "engine": "Surya",
+                "text": lines.text,
+                "confidence": round(lines.avg_confidence, 4),
+                "lines": lines.count,
+                "processing_time": processing_time,
+                "success": True
+            })
+        return results
+    except Exception as e:
+        processing_time = round((time.perf_counter() - start_time) / len(images_pil), 2)
+        return [{
+            "engine": "Surya",
+            "error": str(e),
+            "success": False,
+            "processing_time": processing_time
+        } for _ in images_pil]
+
+
+def _new_tesserocr_api():
+    """Create a tesserocr API with PSM 3 / OEM 3, same as the pytesseract config in process_tesseract"""
+    import tesserocr
+    return tesserocr.PyTessBaseAPI(lang='eng', psm=tesserocr.PSM.AUTO, oem=tesserocr.OEM.DEFAULT)
+
+
+def _init_tesserocr_thread():
+    """Thread pool initializer: give each Tesseract batch thread its own tesserocr API"""
+    _tesserocr_local.api = _new_tesserocr_api()
+
+
+def _text_from_tesseract_data(data: Dict[str, List[Any]]) -> str:
+    """
+    Rebuild the plain text from image_to_data() output, the way image_to_string()
+    lays it out: words joined by spaces, lines by newlines, blocks and paragraphs
+    separated by a blank line.
+    """
+    text = io.StringIO()
+    previous_line = previous_paragraph = None
+    for word, block, paragraph, line in zip(data['text'], data['block_num'],
+                                            data['par_num'], data['line_num']):
+        if not word or not word.strip():
+            continue
+        if (block, paragraph) != previous_paragraph:
+            if previous_paragraph is not None:
+                text.write('\n\n')
+        elif (block, paragraph, line) != previous_line:
+            text.write('\n')
+        else:
+            text.write(' ')
+        text.write(word)
+        previous_paragraph = (block, paragraph)
+        previous_line = (block, paragraph, line)
+    return text.getvalue()
+
+
+def process_tesseract(image_np: "np.ndarray", image_pil: "Image.Image") -> Dict[str, Any]:
     """
     Process image with Tesseract
     Uses PSM 3 (automatic page segmentation) for best results
     Based on: https://tesseract-ocr.github.io/tessdoc/ImproveQuality.html
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     try:
-        pytesseract = OCREngineManager.get_tesseract()
-        if pytesseract is None:
+        import numpy as np
+
+        tesseract = OCREngineManager.get_tesseract()
+        if tesseract is None:
             raise Exception("Tesseract not available")
 
-        from PIL import Image
-        image = Image.open(image_path)
+        if 'tesserocr' in tesseract:
+            # In-process: no subprocess and no PNG round-trip. Batch threads
+            # bring their own API, everything else shares the singleton's
+            api = getattr(_tesserocr_local, 'api', None) or tesseract['tesserocr']
+            api.SetImage(image_pil)
+            text = api.GetUTF8Text()
+            avg_confidence = api.MeanTextConf() / 100.0
+        else:
+            pytesseract = tesseract['pytesseract']
 
-        # PSM 3 = Fully automatic page segmentation (default, best for most cases)
-        # PSM 6 = Assume a single uniform block of text
-        # PSM 11 = Sparse text. Find as much text as possible in no particular order
-        custom_config = r'--oem 3 --psm 3'
+            # PSM 3 = Fully automatic page segmentation (default, best for most cases)
+            # PSM 6 = Assume a single uniform block of text
+            # PSM 11 = Sparse text. Find as much text as possible in no particular order
+            custom_config = r'--oem 3 --psm 3'
 
-        # Get text and confidence data
-        text = pytesseract.image_to_string(image, config=custom_config)
-        data = pytesseract.image_to_data(image, config=custom_config, output_type=pytesseract.Output.DICT)
+            # One tesseract run gives both the words and their confidences
+            data = pytesseract.image_to_data(image_pil, config=custom_config, output_type=pytesseract.Output.DICT)
+            text = _text_from_tesseract_data(data)
 
-        # Calculate average confidence (filter out -1 values)
-        confidences = [float(conf) / 100.0 for conf in data['conf'] if conf != -1]
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            # Calculate average confidence (filter out -1 values). Some pytesseract
+            # versions report confidences as strings, so coerce while converting.
+            confidences = np.asarray(data['conf'], dtype=np.float32)
+            confidences = confidences[confidences != -1]
+            avg_confidence = float(confidences.mean()) / 100.0 if confidences.size else 0.0
 
-        lines = [line for line in text.split('\n') if line.strip()]
+        lines = sum(1 for line in text.splitlines() if line.strip())
 
         return {
             "engine": "Tesseract",
             "text": text.strip(),
             "confidence": round(avg_confidence, 4),
-            "lines": len(lines),
-            "processing_time": round(time.time() - start_time, 2),
+            "lines": lines,
+            "processing_time": round(time.perf_counter() - start_time, 2),
             "success": True
         }
     except Exception as e:
@@ -448,55 +1097,521 @@ def process_tesseract(image_path: str) -> Dict[str, Any]:
             "engine": "Tesseract",
             "error": str(e),
             "success": False,
-            "processing_time": round(time.time() - start_time, 2)
+            "processing_time": round(time.perf_counter() - start_time, 2)
         }
 
 
-def process_image(image_path: str, engines: List[str]) -> Dict[str, Any]:
-    """Process a single image with specified engines"""
+def process_tesseract_batch(images_np: List["np.ndarray"],
+                            images_pil: List["Image.Image"]) -> List[Dict[str, Any]]:
+    """
+    Process several images with Tesseract on the Tesseract thread pool,
+    one image per thread (TESSERACT_THREADS at a time).
+    """
+    pool = OCREngineManager.get_tesseract_pool()
+    if pool is None:
+        return [process_tesseract(image_np, image_pil) for image_np, image_pil in zip(images_np, images_pil)]
+    return list(pool.map(process_tesseract, images_np, images_pil))
+
+
+class RateLimiter:
+    """Spaces request starts at least 1/rps seconds apart (rps <= 0 means unlimited)"""
 
-    # Convert HEIC if needed
-    processed_path = convert_heic_if_needed(image_path)
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def wait(self):
+        """Wait for the next free request slot"""
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+async def _request_paddleocr_vl(session, semaphore: asyncio.Semaphore, vl: Dict[str, Any],
+                                image_url: str) -> Dict[str, Any]:
+    """
+    OCR one image against an OpenAI-compatible PaddleOCR-VL server
+    (paddleocr genai_server / vLLM / SGLang).
+    Retries 429 and 5xx gateway errors with exponential backoff (1s, 2s, ... up to 30s).
+    """
+    start_time = time.perf_counter()
+
+    try:
+        payload = {
+            "model": vl['model'],
+            "messages": [{
+                "role": "user",
+                "content": [
+                    {"type": "image_url", "image_url": {"url": image_url}},
+                    {"type": "text", "text": "OCR:"},
+                ],
+            }],
+            "temperature": 0.0,
+        }
+
+        for attempt in range(1, VL_RETRY_ATTEMPTS + 1):
+            # Back off with the response closed and the slot released, so
+            # other images keep the server busy in the meantime
+            async with semaphore:
+                await vl['limiter'].wait()
+                async with session.post(vl['url'], json=payload) as response:
+                    retry = response.status in VL_RETRY_STATUSES and attempt < VL_RETRY_ATTEMPTS
+                    if not retry:
+                        response.raise_for_status()
+                        body = await response.json()
+            if not retry:
+                break
+            await asyncio.sleep(min(30, 2 ** (attempt - 1)))
+
+        text = body["choices"][0]["message"]["content"].strip()
+        lines = [line for line in text.split('\n') if line.strip()]
+
+        return {
+            "engine": "PaddleOCR-VL",
+            "text": text,
+            # The VL model returns no per-line scores
+            "confidence": None,
+            "lines": len(lines),
+            "processing_time": round(time.perf_counter() - start_time, 2),
+            "success": True
+        }
+    except Exception as e:
+        return {
+            "engine": "PaddleOCR-VL",
+            "error": str(e),
+            "success": False,
+            "processing_time": round(time.perf_counter() - start_time, 2)
+        }
 
-    results = {
+
+async def _gather_paddleocr_vl(vl: Dict[str, Any], image_urls: List[str]) -> List[Dict[str, Any]]:
+    """Send all images concurrently, at most max_concurrency in flight"""
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(vl['max_concurrency'])
+    timeout = aiohttp.ClientTimeout(total=300)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(*(
+            _request_paddleocr_vl(session, semaphore, vl, image_url) for image_url in image_urls
+        ))
+
+
+def process_paddleocr_vl_batch(images_np: List["np.ndarray"],
+                               images_pil: List["Image.Image"]) -> List[Dict[str, Any]]:
+    """Process several images concurrently with a remote PaddleOCR-VL server"""
+    vl = OCREngineManager.get_paddleocr_vl()
+    if vl is None:
+        return [{
+            "engine": "PaddleOCR-VL",
+            "error": "PaddleOCR-VL server not available",
+            "success": False,
+            "processing_time": 0.0
+        } for _ in images_pil]
+
+    image_urls = []
+    for image_pil in images_pil:
+        buffer = io.BytesIO()
+        image_pil.save(buffer, format='PNG')
+        image_urls.append("data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii'))
+
+    return asyncio.run(_gather_paddleocr_vl(vl, image_urls))
+
+
+def process_paddleocr_vl(image_np: "np.ndarray", image_pil: "Image.Image") -> Dict[str, Any]:
+    """Process image with a remote PaddleOCR-VL server"""
+    return process_paddleocr_vl_batch([image_np], [image_pil])[0]
+
+
+# Per-image function of each engine
+ENGINE_FUNCTIONS = {
+    "paddleocr": process_paddleocr,
+    "easyocr": process_easyocr,
+    "surya": process_surya,
+    "tesseract": process_tesseract,
+    "paddleocr-vl": process_paddleocr_vl,
+}
+
+# Engines that can OCR a whole chunk of images in one call
+BATCH_ENGINE_FUNCTIONS = {
+    "easyocr": process_easyocr_batch,
+    "surya": process_surya_batch,
+    "tesseract": process_tesseract_batch,
+    "paddleocr-vl": process_paddleocr_vl_batch,
+}
+
+
+def _log_engine_result(engine: str, engine_result: Dict[str, Any]):
+    """Print a one-line summary of an engine result"""
+    if not VERBOSE:
+        # Skip building the message, vprint would drop it anyway
+        return
+    if engine_result["success"]:
+        confidence = engine_result['confidence']
+        confidence = f"{confidence:.2%}" if confidence is not None else "n/a"
+        vprint(f"✓ {engine}: {engine_result['lines']} lines, "
+               f"{confidence} confidence, "
+               f"{engine_result['processing_time']:.2f}s")
+    else:
+        vprint(f"❌ {engine}: {engine_result.get('error', 'Unknown error')}")
+
+
+def _run_engine(engine: str, image_np: "np.ndarray", image_pil: "Image.Image") -> Dict[str, Any]:
+    """Run a single engine on a single decoded image"""
+    engine_function = ENGINE_FUNCTIONS.get(engine)
+
+    if engine_function is None:
+        return {
+            "engine": engine,
+            "error": "Unknown engine",
+            "success": False
+        }
+
+    vprint(f"\n🔍 Processing with {engine}...")
+    engine_result = engine_function(image_np, image_pil)
+    _log_engine_result(engine, engine_result)
+    return engine_result
+
+
+def load_images(image_paths: List[str], engines: List[str]):
+    """
+    Decode a chunk of images for process_images().
+    Returns (results, loaded): a result dict per image, and (result, DecodedImage)
+    pairs for the images that could be read.
+    """
+    results = [{
         "image": os.path.basename(image_path),
         "image_path": image_path,
         "engines": {}
-    }
+    } for image_path in image_paths]
+
+    # Start the chunk's HEIC images in the decode processes, so they decode
+    # in parallel while the other images are read here
+    heic_pool = heic_decode_pool() if HEIC_SUPPORTED else None
+    pending = {}
+    if heic_pool is not None:
+        pending = {image_path: heic_pool.submit(_load_image_pixels, image_path)
+                   for image_path in image_paths if is_heic(image_path)}
+
+    # Decode each image once (HEIC included) and share it across engines;
+    # unreadable images fail every engine
+    max_side = decode_max_side(engines)
+    loaded = []
+    for image_path, result in zip(image_paths, results):
+        try:
+            image_pil = None
+            if image_path in pending:
+                from PIL import Image
+
+                try:
+                    size, pixels = pending[image_path].result()
+                    image_pil = Image.frombytes('RGB', size, pixels)
+                except BrokenProcessPool:
+                    # A decode process died (e.g. libheif crashed on a malformed
+                    # file); start a fresh pool next chunk and decode here
+                    if _heic_pool is heic_pool:
+                        vprint("⚠️  HEIC decode process died, restarting the decode pool")
+                        shutdown_heic_decode_pool()
+            if image_pil is None:
+                image_pil = load_image(image_path, max_side)
+            loaded.append((result, DecodedImage(image_pil)))
+        except Exception as e:
+            vprint(f"❌ Could not load {os.path.basename(image_path)}: {e}")
+            for engine in engines:
+                result["engines"][engine] = {
+                    "engine": engine,
+                    "error": f"Could not load image: {e}",
+                    "success": False
+                }
+    return results, loaded
+
+
+def run_engines(results: List[Dict[str, Any]], loaded: List[tuple],
+                engines: List[str]) -> List[Dict[str, Any]]:
+    """
+    Run the engines on a chunk decoded by load_images().
+    Several engines run side by side on threads: they use different runtimes
+    (Paddle, torch, libtesseract) that release the GIL, so the chunk takes about
+    as long as the slowest engine instead of the sum. GPU engines sharing one
+    GPU still take turns.
+    """
+    # Downscale up front, so engine threads only read the shared images
+    variants = {engine: [decoded.variant(MAX_SIDE.get(engine)) for _, decoded in loaded]
+                for engine in engines}
+
+    if len(engines) > 1:
+        gpu_engines = GPU_ENGINES.intersection(engines)
+        gpu_lock = None
+        if len(gpu_engines) > 1 and OCREngineManager.get_device() != 'cpu':
+            gpu_lock = threading.Lock()
+
+        def run(engine):
+            with gpu_lock if gpu_lock is not None and engine in gpu_engines else contextlib.nullcontext():
+                return _run_engine_on_chunk(engine, variants[engine])
+
+        with ThreadPoolExecutor(max_workers=len(engines), thread_name_prefix='engine') as pool:
+            engine_results = list(pool.map(run, engines))
+    else:
+        engine_results = [_run_engine_on_chunk(engine, variants[engine]) for engine in engines]
+
+    for engine, chunk_results in zip(engines, engine_results):
+        for (result, _), engine_result in zip(loaded, chunk_results):
+            result["engines"][engine] = engine_result
+
+    return results
+
+
+def _run_engine_on_chunk(engine: str, variants: List[tuple]) -> List[Dict[str, Any]]:
+    """
+    Run one engine on a chunk of (image_np, image_pil) pairs.
+    Engines in BATCH_ENGINE_FUNCTIONS receive the whole chunk in one call,
+    the others are run image by image. If a whole batch fails (an exception,
+    or an error result for every image), the chunk is retried image by image
+    so that one bad image only fails itself. paddleocr-vl is not retried: its
+    batch already sends one independent request per image.
+    """
+    batch_function = BATCH_ENGINE_FUNCTIONS.get(engine)
+    if batch_function is not None and len(variants) > 1:
+        vprint(f"\n🔍 Processing {len(variants)} images with {engine} (batched)...")
+        try:
+            batch_results = batch_function([image_np for image_np, _ in variants],
+                                           [image_pil for _, image_pil in variants])
+        except Exception as e:
+            batch_results = [{"engine": engine, "error": str(e), "success": False} for _ in variants]
+        if engine != 'paddleocr-vl' and not any(result.get('success') for result in batch_results):
+            vprint(f"⚠️  {engine} batch failed ({batch_results[0].get('error')}), processing images one by one")
+            return [_run_engine(engine, image_np, image_pil) for image_np, image_pil in variants]
+        for engine_result in batch_results:
+            _log_engine_result(engine, engine_result)
+        return batch_results
+    return [_run_engine(engine, image_np, image_pil) for image_np, image_pil in variants]
+
+
+def process_images(image_paths: List[str], engines: List[str]) -> List[Dict[str, Any]]:
+    """Process a chunk of images with specified engines"""
+    results, loaded = load_images(image_paths, engines)
+    return run_engines(results, loaded, engines)
 
-    engine_functions = {
-        "paddleocr": process_paddleocr,
-        "easyocr": process_easyocr,
-        "surya": process_surya,
-        "tesseract": process_tesseract,
-    }
 
+def process_image(image_path: str, engines: List[str]) -> Dict[str, Any]:
+    """Process a single image with specified engines"""
+    return process_images([image_path], engines)[0]
+
+
+def _warm_up_inference(engines: List[str]):
+    """
+    Run a dummy 800x600 white image through each local engine (--warmup), so
+    that lazy initialization, JIT compilation and kernel autotuning happen
+    before the first real image instead of during it. cuDNN autotunes per
+    input shape, so on CUDA batched GPU engines get a full BATCH_SIZE batch.
+    """
+    import numpy as np
+    from PIL import Image
+
+    image_pil = Image.new('RGB', (800, 600), 'white')
+    image_np = np.asarray(image_pil)
+    on_cuda = bool(GPU_ENGINES.intersection(engines)) and OCREngineManager.get_device() == 'cuda'
     for engine in engines:
-        # Check if engine is available
-        available = OCREngineManager.get_available_engines()
-        if engine not in engine_functions:
-            results["engines"][engine] = {
-                "engine": engine,
-                "error": "Unknown engine",
-                "success": False
-            }
+        if engine == 'paddleocr-vl':
             continue
+        vprint(f"🔥 Warming up {engine}...")
+        batch_function = BATCH_ENGINE_FUNCTIONS.get(engine)
+        if on_cuda and engine in GPU_ENGINES and batch_function is not None:
+            batch_function([image_np] * BATCH_SIZE, [image_pil] * BATCH_SIZE)
+        else:
+            ENGINE_FUNCTIONS[engine](image_np, image_pil)
 
-        vprint(f"\n🔍 Processing with {engine}...")
-        results["engines"][engine] = engine_functions[engine](processed_path)
 
-        if results["engines"][engine]["success"]:
-            vprint(f"✓ {engine}: {results['engines'][engine]['lines']} lines, "
-                   f"{results['engines'][engine]['confidence']:.2%} confidence, "
-                   f"{results['engines'][engine]['processing_time']}s")
-        else:
-            vprint(f"❌ {engine}: {results['engines'][engine].get('error', 'Unknown error')}")
+async def _handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                         engines: List[str], lock: asyncio.Lock):
+    """Answer JSON-line requests {"path": ..., "engines": [...]} with one JSON result line each"""
+    loop = asyncio.get_running_loop()
+    try:
+        while line := await reader.readline():
+            try:
+                request = load_json(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+                request_engines = request.get('engines') or engines
+                if not isinstance(request_engines, list) or not all(
+                        isinstance(engine, str) and engine in ENGINE_FUNCTIONS for engine in request_engines):
+                    raise ValueError(f"engines must be a list of: {', '.join(ENGINE_FUNCTIONS)}")
+                # Engines are shared, so images are processed one at a time
+                async with lock:
+                    result = await loop.run_in_executor(None, process_image, request['path'], request_engines)
+            except Exception as e:
+                result = {"error": str(e), "success": False}
+            writer.write(dump_json(result) + b"\n")
+            await writer.drain()
+    finally:
+        writer.close()
 
-    return results
+
+def _socket_identity(path: str) -> Optional[tuple]:
+    """(device, inode) of the unix socket at path, or None if path is missing or not a socket"""
+    try:
+        path_stat = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(path_stat.st_mode):
+        return None
+    return path_stat.st_dev, path_stat.st_ino
+
+
+async def _serve(socket_path: str, engines: List[str], created: List[tuple]):
+    """Serve OCR requests on a unix socket until SIGINT/SIGTERM (the socket's identity goes into created)"""
+    loop = asyncio.get_running_loop()
+    stopped = loop.create_future()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: stopped.done() or stopped.set_result(None))
+
+    lock = asyncio.Lock()
+    server = await asyncio.start_unix_server(
+        lambda reader, writer: _handle_client(reader, writer, engines, lock),
+        path=socket_path
+    )
+    created.append(_socket_identity(socket_path))
+    print(f"🛰️  Serving {', '.join(engines)} on {socket_path} (Ctrl+C to stop)")
+    async with server:
+        await stopped
+
+
+def serve(socket_path: str, engines: List[str]):
+    """
+    Keep the engines loaded and answer requests from ocr_tool_client.py,
+    so model loading is paid once instead of on every invocation.
+    """
+    if _socket_identity(socket_path) is not None:
+        # Stale socket from an earlier server
+        os.remove(socket_path)
+    elif os.path.lexists(socket_path):
+        print(f"❌ Not a socket, refusing to replace: {socket_path}")
+        sys.exit(1)
+
+    created = []
+    try:
+        asyncio.run(_serve(socket_path, engines, created))
+    finally:
+        # Only remove the socket this server created, not whatever took its place
+        if created and _socket_identity(socket_path) == created[0]:
+            os.remove(socket_path)
+
+
+def _init_worker(verbose: bool, engines: List[str], engine_config: Dict[str, Any],
+                 max_side: Dict[str, Optional[int]], heic_cache_dir: Optional[Path], warmup: bool):
+    """
+    Process pool initializer for batch mode.
+    Pins the native thread pools to one thread per worker (the pool already
+    provides the parallelism) and loads (and with --warmup, warms up) the
+    engines once per worker.
+    """
+    global VERBOSE, HEIC_CACHE_DIR, TESSERACT_THREADS, _worker_engines
+    VERBOSE = verbose
+    HEIC_CACHE_DIR = heic_cache_dir
+    TESSERACT_THREADS = 1
+    os.environ['OMP_NUM_THREADS'] = '1'
+    os.environ['MKL_NUM_THREADS'] = '1'
+    MAX_SIDE.update(max_side)
+    OCREngineManager.configure(**{**engine_config, 'paddle_cpu_threads': 1})
+    _worker_engines = OCREngineManager.warm_up(engines)
+    if warmup:
+        _warm_up_inference(_worker_engines)
+
+
+def _get_worker_engines() -> List[str]:
+    """The engines that initialized in this worker process"""
+    return _worker_engines
+
+
+def _prefetch(iterable, maxsize: int = 1):
+    """
+    Iterate over `iterable` on a background thread, keeping up to `maxsize`
+    items ready, so producing the next item overlaps with consuming this one.
+    The producer works on one more item while the queue is full, so up to
+    maxsize + 2 items are alive at once (counting the one being consumed).
+    """
+    done = object()
+    buffer = queue.Queue(maxsize=maxsize)
+    failure = []
+
+    def produce():
+        try:
+            for item in iterable:
+                buffer.put(item)
+        except Exception as e:
+            failure.append(e)
+        buffer.put(done)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (item := buffer.get()) is not done:
+        yield item
+    if failure:
+        raise failure[0]
+
+
+class BackgroundWriter:
+    """
+    Calls `function(*args)` for each submit() on a single background thread,
+    in submission order, so writing results overlaps with the next OCR call.
+    """
+
+    def __init__(self, function, maxsize: int = 4):
+        self._function = function
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._failure = None
+        self._thread = threading.Thread(target=self._consume, daemon=True)
+        self._thread.start()
+
+    def _consume(self):
+        while (args := self._queue.get()) is not None:
+            if self._failure is None:
+                try:
+                    self._function(*args)
+                except Exception as e:
+                    self._failure = e
+
+    def submit(self, *args):
+        """Queue a call (blocks while `maxsize` calls are pending)"""
+        if self._failure is not None:
+            raise self._failure
+        self._queue.put(args)
+
+    def close(self):
+        """Wait for pending calls to finish, re-raising the first error"""
+        self._queue.put(None)
+        self._thread.join()
+        if self._failure is not None:
+            raise self._failure
+
+
+def _jsonl_to_json_array(jsonl_path: Path, json_path: Path) -> Path:
+    """
+    Convert a JSON-lines file into an indented JSON array, one line at a time,
+    so the results never have to fit in memory together.
+    """
+    with open(jsonl_path, 'rb') as src, open(json_path, 'wb', buffering=1 << 20) as dst:
+        dst.write(b'[')
+        separator = b'\n'
+        for line in src:
+            # Same layout as an indented list: each item indented one level
+            item = dump_json(load_json(line), indent=True)
+            dst.write(separator + b'  ' + item.replace(b'\n', b'\n  '))
+            separator = b',\n'
+        dst.write(b'\n]' if separator != b'\n' else b']')
+    return json_path
+
+
+def _chunked(items, size: int):
+    """Yield successive lists of at most `size` items"""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
 
 
 def main():
-    global VERBOSE
+    global VERBOSE, HEIC_CACHE_DIR, BATCH_SIZE, HEIC_DECODE_WORKERS, HEIC_MEMORY_CACHE
 
     parser = argparse.ArgumentParser(
         description=f'Advanced OCR Tool v{__version__} - Performance Optimized',
@@ -512,6 +1627,19 @@ Examples:
   # Batch processing
   %(prog)s --engine paddleocr --input-dir ./images/ --output-dir ./results/
 
+  # Batch processing, 32 images per EasyOCR/Surya call
+  %(prog)s --engine surya --input-dir ./images/ --batch-size 32
+
+  # Batch processing on every CPU core
+  %(prog)s --engine tesseract --input-dir ./images/ --workers 0
+
+  # Remote PaddleOCR-VL server, 16 requests in flight, at most 10 per second
+  %(prog)s --engine paddleocr-vl --vl-server-url http://localhost:8118/v1 \\
+      --input-dir ./images/ --max-concurrency 16 --rps 10
+
+  # Keep PaddleOCR loaded and serve requests from ocr_tool_client.py
+  %(prog)s --engine paddleocr --serve /tmp/ocr.sock
+
   # HEIC image
   %(prog)s --engine paddleocr --input IMG_0371.heic
 
@@ -523,24 +1651,69 @@ Engines:
   easyocr    - Good with challenging backgrounds
   surya      - Modern, handles noise well
   tesseract  - Fast, good for clean images
+  paddleocr-vl - Remote PaddleOCR-VL server (needs --vl-server-url)
   all        - Run all available engines
+
+PaddleOCR high-performance inference (--hpi) needs extra dependencies:
+  paddleocr install_hpi_deps cpu    # or: gpu
         '''
     )
 
     parser.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
     parser.add_argument('--engine',
-                        choices=['paddleocr', 'easyocr', 'surya', 'tesseract', 'all'],
+                        choices=['paddleocr', 'easyocr', 'surya', 'tesseract', 'paddleocr-vl', 'all'],
                         default='paddleocr',
                         help='OCR engine to use (default: paddleocr)')
     parser.add_argument('--input', help='Input image file')
     parser.add_argument('--input-dir', help='Input directory for batch processing')
     parser.add_argument('--output', help='Output JSON file')
     parser.add_argument('--output-dir', help='Output directory for batch processing')
+    parser.add_argument('--format', choices=['ndjson', 'json'], default='ndjson',
+                        help='Combined batch results: ndjson streams batch_results.jsonl, '
+                             'json also converts it into a batch_results.json array (default: ndjson)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f'Images per engine call in batch mode (default: {BATCH_SIZE})')
+    parser.add_argument('--device', choices=['auto', 'cpu', 'cuda', 'mps'], default='auto',
+                        help='Device for PaddleOCR/EasyOCR/Surya (default: auto-detect)')
+    parser.add_argument('--hpi', action=argparse.BooleanOptionalAction, default=True,
+                        help='PaddleOCR high-performance inference (default: on, falls back if unavailable)')
+    parser.add_argument('--vl-server-url',
+                        help='OpenAI-compatible PaddleOCR-VL server, e.g. http://localhost:8118/v1 '
+                             '(enables the paddleocr-vl engine)')
+    parser.add_argument('--vl-model', default='PaddleOCR-VL-0.9B',
+                        help='Model name served by --vl-server-url (default: PaddleOCR-VL-0.9B)')
+    parser.add_argument('--max-concurrency', type=int, default=8,
+                        help='Concurrent requests to --vl-server-url (default: 8)')
+    parser.add_argument('--rps', type=float, default=0.0,
+                        help='Request rate limit for --vl-server-url, 0 = unlimited (default: 0)')
+    parser.add_argument('--surya-det-batch', type=int,
+                        help='Surya detector batch size (default: from GPU memory, 4/16/32)')
+    parser.add_argument('--surya-rec-batch', type=int,
+                        help='Surya recognizer batch size (default: from GPU memory, 4/16/32)')
+    parser.add_argument('--heic-cache', action='store_true',
+                        help='Cache decoded HEIC images (lossless PNG) in $XDG_CACHE_HOME/advanced-ocr/heic '
+                             'so repeat runs skip HEVC decoding')
+    parser.add_argument('--max-side', type=int,
+                        help='Downscale images to this many pixels on the long side for every engine, '
+                             '0 = never (default: paddleocr/easyocr 1600, tesseract 2400, surya full size)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes for batch mode, 0 = one per CPU core (default: 1). '
+                             'Each worker loads its own copy of the models; ignored when a GPU or '
+                             'paddleocr-vl is used')
+    parser.add_argument('--warmup', action=argparse.BooleanOptionalAction, default=True,
+                        help='Run a dummy image through the engines before batch/server mode, so the first '
+                             'real image does not pay for lazy initialization (default: on)')
+    parser.add_argument('--serve', metavar='SOCKET_PATH',
+                        help='Keep engines loaded and serve requests on a unix socket (see ocr_tool_client.py)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output (default)')
     parser.add_argument('--quiet', '-q', action='store_true', help='Quiet mode (minimal output)')
 
     args = parser.parse_args()
 
+    # Load CUDA kernels on first use instead of all at once when torch starts
+    # (inherited by --workers processes)
+    os.environ.setdefault('CUDA_MODULE_LOADING', 'LAZY')
+
     # Set verbose mode
     if args.quiet:
         VERBOSE = False
@@ -551,31 +1724,94 @@ Engines:
     vprint(f"🚀 Advanced OCR Tool v{__version__} - Performance Optimized")
     vprint(f"{'='*60}")
 
-    # Determine which engines to use
+    BATCH_SIZE = max(1, args.batch_size)
+
+    if args.heic_cache:
+        HEIC_CACHE_DIR = default_heic_cache_dir()
+
+    if args.max_side is not None:
+        MAX_SIDE.update(dict.fromkeys(MAX_SIDE, args.max_side or None))
+
+    OCREngineManager.configure(
+        device=args.device,
+        paddle_hpi=args.hpi,
+        vl_server_url=args.vl_server_url,
+        vl_model=args.vl_model,
+        vl_max_concurrency=args.max_concurrency,
+        vl_rps=args.rps,
+        surya_det_batch=args.surya_det_batch,
+        surya_rec_batch=args.surya_rec_batch,
+        paddle_mkldnn=bool(args.input_dir or args.serve),
+    )
+
+    # Batch mode with several workers: every worker loads its own engines
+    workers = 1
+    if args.input_dir and not args.serve:
+        workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
+    # Determine which engines to use, loading their models once up front
     if args.engine == 'all':
-        # Try to initialize all engines
-        OCREngineManager.get_paddleocr()
-        OCREngineManager.get_easyocr()
-        OCREngineManager.get_surya()
-        OCREngineManager.get_tesseract()
-        engines = OCREngineManager.get_available_engines()
-
-        if not engines:
-            print("❌ No OCR engines available!")
-            print("\nInstall at least one engine:")
-            print("  Docker: docker build -t python-advanced-ocr .")
-            print("  Or pip: pip install paddleocr easyocr surya-ocr pytesseract")
-            sys.exit(1)
+        all_engines = ['paddleocr', 'easyocr', 'surya', 'tesseract']
+        if args.vl_server_url:
+            all_engines.append('paddleocr-vl')
+        engines = OCREngineManager.probe_engines(all_engines)
     else:
         engines = [args.engine]
 
+    if workers > 1 and GPU_ENGINES.intersection(engines) and OCREngineManager.get_device() != 'cpu':
+        # A single GPU context can't be shared across processes cleanly
+        vprint("⚠️  GPU in use, ignoring --workers and processing serially")
+        workers = 1
+    if workers > 1 and 'paddleocr-vl' in engines:
+        # --rps and --max-concurrency are per process; the requests are
+        # concurrent already, so extra workers would only multiply the limits
+        vprint("⚠️  paddleocr-vl in use, ignoring --workers and processing serially")
+        workers = 1
+
+    # Drop engines that failed to initialize, once, instead of failing every image
+    executor = None
+    if workers == 1:
+        engines = OCREngineManager.warm_up(engines)
+        # A single image would only pay the warm-up cost on top of its own
+        if args.warmup and (args.serve or args.input_dir):
+            _warm_up_inference(engines)
+    else:
+        # The parent loads no models; every worker loads the same engines,
+        # so ask one worker which of them initialized
+        vprint(f"⚙️  Using {workers} worker processes")
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(False, engines, OCREngineManager.get_config(), MAX_SIDE, HEIC_CACHE_DIR,
+                      args.warmup)
+        )
+        engines = executor.submit(_get_worker_engines).result()
+
+    if not engines:
+        if executor is not None:
+            executor.shutdown()
+        if args.engine == 'all':
+            print("❌ No OCR engines available!")
+        else:
+            print(f"❌ OCR engine not available: {args.engine} (run with --verbose for details)")
+        print("\nInstall at least one engine:")
+        print("  Docker: docker build -t python-advanced-ocr .")
+        print("  Or pip: pip install paddleocr easyocr surya-ocr pytesseract")
+        sys.exit(1)
+
     if HEIC_SUPPORTED:
         vprint("✓ HEIC support enabled")
     if HAS_TQDM:
         vprint("✓ Progress bars enabled")
 
+    # Server mode
+    if args.serve:
+        HEIC_MEMORY_CACHE = True
+        serve(args.serve, engines)
+
     # Batch processing
-    if args.input_dir:
+    elif args.input_dir:
         if not args.output_dir:
             args.output_dir = './output'
 
@@ -584,45 +1820,96 @@ Engines:
             sys.exit(1)
 
         # Find all image files
-        input_path = Path(args.input_dir)
         output_path = Path(args.output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.heic', '.heif'}
-        image_files = [f for f in input_path.rglob('*')
-                       if f.is_file() and f.suffix.lower() in image_extensions]
+        # Images are processed while the directory walk is still running,
+        # so only peek at the first one to rule out an empty directory
+        image_iter = iter_images(args.input_dir)
+        first_image = next(image_iter, None)
 
-        if not image_files:
+        if first_image is None:
             print(f"❌ No images found in {args.input_dir}")
             sys.exit(1)
 
-        vprint(f"\n📁 Found {len(image_files)} images in {args.input_dir}")
+        image_files = itertools.chain([first_image], image_iter)
+
+        vprint(f"\n📁 Processing images in {args.input_dir}")
         vprint(f"🎯 Processing with engines: {', '.join(engines)}\n")
 
-        results = []
+        # Results stream to batch_results.jsonl, one line per image as images finish
+        # (constant memory, partial results survive a crash); --format json
+        # converts it into an array afterwards
+        combined_file = output_path / "batch_results.jsonl"
+        combined_f = open(combined_file, 'wb', buffering=1 << 20)
+
+        # Per-file results are written here and renamed into place, so readers
+        # of the output directory never see a half-written file
+        staging_path = output_path / ".tmp"
+        staging_path.mkdir(exist_ok=True)
 
         # Use tqdm if available and not in quiet mode
-        iterator = tqdm(image_files, desc="Processing images", disable=not VERBOSE) if HAS_TQDM else image_files
+        # (the total isn't known until the walk finishes)
+        progress = tqdm(desc="Processing images", unit="img", disable=not VERBOSE) if HAS_TQDM else None
+
+        chunks = _chunked(image_files, BATCH_SIZE)
 
-        for image_file in iterator:
+        if executor is not None:
+            chunk_results_iter = executor.map(process_images, chunks, itertools.repeat(engines))
+        else:
+            # Decode the next chunk on a loader thread while the engines work on
+            # this one, HEIC images in parallel processes. Decoded chunks are
+            # large (a 12 MP photo is 36 MB), so only one is queued
+            HEIC_DECODE_WORKERS = os.cpu_count() or 1
+            loaded_iter = _prefetch(map(load_images, chunks, itertools.repeat(engines)))
+            chunk_results_iter = (run_engines(chunk_results, loaded, engines)
+                                  for chunk_results, loaded in loaded_iter)
+
+        processed = 0
+
+        def write_chunk(chunk_results: List[Dict[str, Any]]):
+            nonlocal processed
             if not HAS_TQDM and VERBOSE:
                 vprint(f"\n{'='*60}")
-                vprint(f"📸 Processing: {image_file.name}")
+                vprint(f"📸 Processed: {', '.join(result['image'] for result in chunk_results)}")
+
+            for result in chunk_results:
+                combined_f.write(dump_json(result) + b"\n")
+
+                # Save individual result (no fsync: a crash loses at most the
+                # current chunk, which batch_results.jsonl also records)
+                result_name = f"{Path(result['image_path']).stem}_result.json"
+                with open(staging_path / result_name, 'wb') as f:
+                    f.write(dump_json(result, indent=True))
+                os.replace(staging_path / result_name, output_path / result_name)
+
+            combined_f.flush()
+
+            processed += len(chunk_results)
+            if progress is not None:
+                progress.update(len(chunk_results))
+
+        # Results are written on a writer thread, overlapping with the next chunk's OCR
+        writer = BackgroundWriter(write_chunk)
+        for chunk_results in chunk_results_iter:
+            writer.submit(chunk_results)
+        writer.close()
+        with contextlib.suppress(OSError):
+            staging_path.rmdir()
 
-            result = process_image(str(image_file), engines)
-            results.append(result)
+        if executor is not None:
+            executor.shutdown()
+        shutdown_heic_decode_pool()
 
-            # Save individual result
-            result_file = output_path / f"{image_file.stem}_result.json"
-            with open(result_file, 'w') as f:
-                json.dump(result, f, indent=2)
+        if progress is not None:
+            progress.close()
 
         # Save combined results
-        combined_file = output_path / "batch_results.json"
-        with open(combined_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        combined_f.close()
+        if args.format == 'json':
+            combined_file = _jsonl_to_json_array(combined_file, output_path / "batch_results.json")
 
-        print(f"\n✅ Batch processing complete!")
+        print(f"\n✅ Batch processing complete! ({processed} images)")
         print(f"📊 Results saved to: {combined_file}")
 
     # Single image processing
@@ -641,17 +1928,18 @@ Engines:
         for engine, data in result["engines"].items():
             if data["success"]:
                 print(f"\n{engine.upper()}:")
-                print(f"  Confidence: {data['confidence']:.2%}")
+                if data['confidence'] is not None:
+                    print(f"  Confidence: {data['confidence']:.2%}")
                 print(f"  Lines: {data['lines']}")
-                print(f"  Time: {data['processing_time']}s")
+                print(f"  Time: {data['processing_time']:.2f}s")
                 print(f"  Text preview: {data['text'][:100]}...")
             else:
                 print(f"\n{engine.upper()}: FAILED - {data.get('error', 'Unknown error')}")
 
         # Save to file if requested
         if args.output:
-            with open(args.output, 'w') as f:
-                json.dump(result, f, indent=2)
+            with open(args.output, 'wb') as f:
+                f.write(dump_json(result, indent=True))
             print(f"\n💾 Results saved to: {args.output}")
 
     else:
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Client for `ocr_tool.py --serve`
+Sends images to a running OCR server over its unix socket, so the models
+stay loaded between invocations.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional
+
+
+def ocr_images(socket_path: str, image_paths: List[str],
+               engines: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Send images to the server over one connection, return one result per image"""
+    results = []
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile('rw', encoding='utf-8') as stream:
+            for image_path in image_paths:
+                # The server may run in another working directory
+                request = {"path": os.path.abspath(image_path)}
+                if engines:
+                    request["engines"] = engines
+                stream.write(json.dumps(request) + "\n")
+                stream.flush()
+                line = stream.readline()
+                if not line:
+                    raise ConnectionError("server closed the connection")
+                results.append(json.loads(line))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Send images to a running `ocr_tool.py --serve` server')
+    parser.add_argument('socket', help='Server socket path')
+    parser.add_argument('images', nargs='+', help='Image files')
+    parser.add_argument('--engine', action='append', dest='engines',
+                        help='Engine to use (repeatable, default: the server\'s engines)')
+    args = parser.parse_args()
+
+    try:
+        results = ocr_images(args.socket, args.images, args.engines)
+    except OSError as e:
+        print(f"❌ Could not reach OCR server at {args.socket}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()